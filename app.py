@@ -6,12 +6,13 @@ from utils_local import (
     translate_text,
     get_language_code,
     text_to_audio,
-    generate_session_id
+    generate_session_id,
+    start_background_warm_up
 )
+from chunking import CHUNKING_STRATEGIES
 import tempfile
+import hashlib
 import os
-from audio_recorder_streamlit import audio_recorder
-import speech_recognition as sr
 
 # ----------------------------
 # Page Configuration
@@ -55,6 +56,11 @@ if "logged_in" not in st.session_state:
 if not st.session_state.logged_in:
     login()
     st.stop()
+
+# Preload heavy backends while the user picks a language and uploads a file.
+# Set VOICEBOT_WARM_UP=0 to disable.
+if os.getenv("VOICEBOT_WARM_UP", "1") != "0":
+    start_background_warm_up()
 ###########################3
 st.set_page_config(page_title="Multilingual Voice Chatbot", layout="centered")
 st.title("Multilingual Voice Chatbot")
@@ -72,13 +78,34 @@ lang_code = get_language_code(language)
 # ----------------------------
 uploaded_file = st.file_uploader("📄 Upload a document (.pdf, .docx, .txt)", type=["pdf", "docx", "txt"])
 
+with st.expander("⚙️ Chunking settings"):
+    chunk_strategy = st.selectbox("Strategy", list(CHUNKING_STRATEGIES))
+    strategy_defaults = CHUNKING_STRATEGIES[chunk_strategy]
+    unit = "tokens" if chunk_strategy == "token" else "characters"
+    chunk_size = st.number_input(f"Chunk size ({unit})", min_value=50, max_value=8000,
+                                 value=strategy_defaults["chunk_size"], step=50,
+                                 key=f"chunk_size_{chunk_strategy}")
+    chunk_overlap = st.number_input(f"Chunk overlap ({unit})", min_value=0, max_value=chunk_size - 1,
+                                    value=min(strategy_defaults["chunk_overlap"], chunk_size - 1), step=10,
+                                    key=f"chunk_overlap_{chunk_strategy}")
+chunking = {"strategy": chunk_strategy, "chunk_size": int(chunk_size), "chunk_overlap": int(chunk_overlap)}
+
 if uploaded_file:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[-1]) as tmp:
-        tmp.write(uploaded_file.read())
-        doc_path = tmp.name
+    # Build the index once per uploaded file and chunking setting instead of on every rerun
+    doc_bytes = uploaded_file.getvalue()
+    doc_key = (hashlib.sha256(doc_bytes).hexdigest(), tuple(sorted(chunking.items())))
+    if st.session_state.get("retriever_key") != doc_key:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[-1]) as tmp:
+            tmp.write(doc_bytes)
+            doc_path = tmp.name
+        try:
+            st.session_state.retriever = load_document_vectorstore(doc_path, chunking)
+        finally:
+            os.unlink(doc_path)
+        st.session_state.retriever_key = doc_key
 
     st.success("✅ Document uploaded successfully!")
-    retriever = load_document_vectorstore(doc_path)
+    retriever = st.session_state.retriever
 
     # ----------------------------
     # Conversation Section
@@ -115,6 +142,9 @@ if uploaded_file:
     # Speak Mode
     # ----------------------------
     elif input_mode == "Speak":
+        from audio_recorder_streamlit import audio_recorder
+        import speech_recognition as sr
+
         st.markdown("### 🎙️ Voice Recording")
         st.markdown("**Instructions:** Click the microphone icon. When it turns **Red**, start speaking. Click again to **stop** recording and Mic trun **Black**. "
         "**First time audio click for each new Chat will setup Microphone Stability**. ")
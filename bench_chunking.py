@@ -0,0 +1,164 @@
+"""Compare chunking strategies on local fixture documents.
+
+For every strategy in chunking.CHUNKING_STRATEGIES this reports chunk counts,
+index size, embedding tokens and cost, retrieval latency, prompt (context)
+tokens for the top-k chunks, and hit@k: how often the expected answer text
+from fixtures/questions.json appears in the retrieved context.
+
+By default a local hashed bag-of-words embedding is used so the benchmark
+costs nothing; pass --openai to use OpenAIEmbeddings (needs OPENAI_API_KEY).
+Embedding cost is always estimated from token counts. Token counts use
+tiktoken's cl100k_base, which is downloaded on first use; fully offline
+without a cached copy, counts fall back to a 4 chars/token estimate and the
+token strategy is skipped.
+
+Usage:
+    python bench_chunking.py
+    python bench_chunking.py --strategies recursive structure --chunk-size 600
+    python bench_chunking.py --docs my.pdf --questions my_questions.json --openai
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+import statistics
+import time
+
+from langchain_core.embeddings import Embeddings
+
+from chunking import CHUNKING_STRATEGIES, split_documents
+from utils_local import load_documents
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "fixtures")
+
+
+class HashingEmbeddings(Embeddings):
+    """Offline stand-in for OpenAIEmbeddings: L2-normalised hashed word counts."""
+
+    def __init__(self, size: int = 1536):
+        self.size = size
+
+    def _embed(self, text: str):
+        vector = [0.0] * self.size
+        for word in re.findall(r"\w+", text.lower()):
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.size] += 1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts):
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+def load_token_counter():
+    """Return (count_tokens, description).
+
+    tiktoken downloads cl100k_base on first use. When it is not cached and
+    cannot be fetched, fall back to the usual ~4 characters per token estimate.
+    """
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"tiktoken cl100k_base unavailable ({type(e).__name__}); estimating 4 chars/token")
+        return (lambda text: math.ceil(len(text) / 4)), "estimated (4 chars/token)"
+    return (lambda text: len(encoding.encode(text, disallowed_special=()))), "tiktoken cl100k_base"
+
+
+def evaluate(strategy, docs, questions, embeddings, count_tokens, args):
+    from langchain_community.vectorstores import FAISS
+
+    chunking = {"strategy": strategy, "chunk_size": args.chunk_size, "chunk_overlap": args.chunk_overlap}
+    t = time.perf_counter()
+    chunks = split_documents(docs, chunking)
+    split_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    vectorstore = FAISS.from_documents(chunks, embeddings)
+    index_s = time.perf_counter() - t
+
+    chunk_tokens = [count_tokens(c.page_content) for c in chunks]
+    text_bytes = sum(len(c.page_content.encode("utf-8")) for c in chunks)
+    vector_bytes = vectorstore.index.ntotal * vectorstore.index.d * 4
+
+    latencies, prompt_tokens, hits = [], [], 0
+    for q in questions:
+        t = time.perf_counter()
+        found = vectorstore.similarity_search(q["question"], k=args.k)
+        latencies.append(time.perf_counter() - t)
+        context = "\n\n".join(d.page_content for d in found)
+        prompt_tokens.append(count_tokens(context))
+        normalized = " ".join(context.split()).lower()
+        hits += q.get("expect", "").lower() in normalized
+
+    embed_tokens = sum(chunk_tokens)
+    return {
+        "strategy": strategy,
+        "chunks": len(chunks),
+        "avg_tok": statistics.mean(chunk_tokens) if chunks else 0,
+        "max_tok": max(chunk_tokens, default=0),
+        "index_kb": (vector_bytes + text_bytes) / 1024,
+        "embed_tok": embed_tokens,
+        "cost": embed_tokens / 1000 * args.price_per_1k,
+        "build_ms": (split_s + index_s) * 1000,
+        "query_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "prompt_tok": statistics.mean(prompt_tokens) if prompt_tokens else 0,
+        "hit": hits / len(questions) if questions else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", nargs="+", help="documents to index (default: fixtures/*)")
+    parser.add_argument("--questions", default=os.path.join(FIXTURES, "questions.json"))
+    parser.add_argument("--strategies", nargs="+", default=list(CHUNKING_STRATEGIES),
+                        choices=list(CHUNKING_STRATEGIES))
+    parser.add_argument("--chunk-size", type=int, help="override per-strategy default (tokens for \"token\", else characters)")
+    parser.add_argument("--chunk-overlap", type=int, help="override per-strategy default (tokens for \"token\", else characters)")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--openai", action="store_true", help="embed with OpenAIEmbeddings")
+    parser.add_argument("--price-per-1k", type=float, default=0.0001,
+                        help="embedding price in USD per 1K tokens")
+    args = parser.parse_args()
+
+    count_tokens, token_source = load_token_counter()
+    if token_source != "tiktoken cl100k_base" and "token" in args.strategies:
+        print("skipping the token strategy: TokenTextSplitter needs the tiktoken encoding")
+        args.strategies = [s for s in args.strategies if s != "token"]
+    if args.openai:
+        from dotenv import load_dotenv
+        from langchain_openai import OpenAIEmbeddings
+        load_dotenv()
+        embeddings = OpenAIEmbeddings()
+    else:
+        embeddings = HashingEmbeddings()
+
+    paths = args.docs or sorted(
+        p for p in glob.glob(os.path.join(FIXTURES, "*")) if p.endswith((".pdf", ".txt", ".docx"))
+    )
+    docs = [d for path in paths for d in load_documents(path)]
+    with open(args.questions, encoding="utf-8") as f:
+        questions = json.load(f)
+
+    print(f"{len(paths)} document(s), {len(docs)} page(s), {len(questions)} question(s), k={args.k}, "
+          f"embeddings={'openai' if args.openai else 'hashing (offline)'}, tokens={token_source}")
+    header = (f"{'strategy':<10} {'chunks':>6} {'avg tok':>7} {'max tok':>7} {'index KB':>8} "
+              f"{'embed tok':>9} {'cost $':>8} {'build ms':>8} {'query ms':>8} {'prompt tok':>10} {'hit@k':>6}")
+    print(header)
+    print("-" * len(header))
+    for strategy in args.strategies:
+        r = evaluate(strategy, docs, questions, embeddings, count_tokens, args)
+        print(f"{r['strategy']:<10} {r['chunks']:>6} {r['avg_tok']:>7.0f} {r['max_tok']:>7} "
+              f"{r['index_kb']:>8.1f} {r['embed_tok']:>9} {r['cost']:>8.5f} {r['build_ms']:>8.1f} "
+              f"{r['query_ms']:>8.2f} {r['prompt_tok']:>10.0f} {r['hit']:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Startup benchmark for the voice chatbot.
+
+Measures, in fresh interpreters:
+  * time-to-login-page: importing what app.py needs before the login form renders
+  * eager backend import: what every worker used to pay up front
+  * time-to-first-answer (optional, needs OPENAI_API_KEY and --doc): index a
+    document and answer one question, cold vs. after warm_up(). Both runs use
+    the in-memory index; VOICEBOT_INDEX_DIR is disabled for them
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --doc sample.pdf --question "What is this about?"
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+LOGIN_PAGE_SNIPPET = """
+import time
+t = time.perf_counter()
+import streamlit, dotenv, utils_local
+print(time.perf_counter() - t)
+"""
+
+EAGER_IMPORT_SNIPPET = """
+import time
+t = time.perf_counter()
+import streamlit, dotenv, utils_local
+import langchain_openai, langchain_community.document_loaders, langchain.text_splitter
+import langchain_community.vectorstores, faiss, gtts, deep_translator, speech_recognition
+print(time.perf_counter() - t)
+"""
+
+FIRST_ANSWER_SNIPPET = """
+import sys, time
+from dotenv import load_dotenv
+load_dotenv()
+t = time.perf_counter()
+import utils_local
+if sys.argv[1] == "warm":
+    utils_local.warm_up()
+    t = time.perf_counter()
+retriever = utils_local.load_document_vectorstore(sys.argv[2])
+utils_local.get_qa_response(sys.argv[3], retriever)
+print(time.perf_counter() - t)
+"""
+
+
+def run_snippet(snippet: str, *args: str) -> float:
+    # Set (not unset) VOICEBOT_INDEX_DIR to "" so load_dotenv() cannot restore
+    # it: a persisted index written by the cold run would make the warm run
+    # skip embedding and overstate the warm-up gain.
+    env = dict(os.environ, VOICEBOT_INDEX_DIR="")
+    out = subprocess.run(
+        [sys.executable, "-c", snippet, *args],
+        cwd=HERE, env=env, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def report(label: str, snippet: str, repeat: int, *args: str):
+    try:
+        times = [run_snippet(snippet, *args) for _ in range(repeat)]
+    except subprocess.CalledProcessError as e:
+        print(f"{label:<36} failed: {e.stderr.strip().splitlines()[-1]}")
+        return
+    print(f"{label:<36} median {statistics.median(times):7.3f}s  "
+          f"min {min(times):7.3f}s  (n={repeat})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--doc", help="document to index for time-to-first-answer")
+    parser.add_argument("--question", default="What is this document about?")
+    args = parser.parse_args()
+
+    report("time-to-login-page (lazy)", LOGIN_PAGE_SNIPPET, args.repeat)
+    report("login page + eager backend imports", EAGER_IMPORT_SNIPPET, args.repeat)
+
+    if args.doc:
+        doc = os.path.abspath(args.doc)
+        report("time-to-first-answer (cold)", FIRST_ANSWER_SNIPPET, 1, "cold", doc, args.question)
+        report("time-to-first-answer (warmed up)", FIRST_ANSWER_SNIPPET, 1, "warm", doc, args.question)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Memory and load-time benchmark: in-memory FAISS vs. memory-mapped vector store.
+
+Synthetic unit vectors and chunk texts are written once, then several worker
+processes load the same index concurrently, like Streamlit workers would:
+
+  * faiss    FAISS.from_embeddings in every worker (the current in-RAM approach,
+             minus the embedding API calls)
+  * float16  vector_store.py file opened read-only with mmap
+  * int8     same, with int8 vectors and per-row scales
+
+Per worker it reports load time (excluding imports), query latency and the growth of RSS and PSS
+(proportional set size, which splits shared pages between the processes that
+map them) during load + queries. Recall@k of the quantized stores is measured
+against exact float32 search. PSS needs Linux /proc/<pid>/smaps_rollup.
+
+Usage:
+    python bench_vector_store.py
+    python bench_vector_store.py --count 50000 --workers 8
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from vector_store import open_vector_store, write_vector_store
+
+KINDS = ("faiss", "float16", "int8")
+
+
+def memory_kb():
+    """Return (rss_kb, pss_kb) for this process; pss is None where unavailable."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(fields["Rss"].split()[0]), int(fields["Pss"].split()[0])
+    except (OSError, KeyError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, None
+
+
+def query_vectors(dim: int, n: int):
+    return np.random.default_rng(1).standard_normal((n, dim)).astype(np.float32)
+
+
+def run_worker(kind: str, data_dir: str, k: int, n_queries: int):
+    vectors_path = os.path.join(data_dir, "vectors.npy")
+    dim = np.load(vectors_path, mmap_mode="r").shape[1]
+    queries = query_vectors(dim, n_queries)
+    if kind == "faiss":
+        # Import before the baseline so only the index itself is measured
+        from langchain_community.embeddings import FakeEmbeddings
+        from langchain_community.vectorstores import FAISS
+    rss0, pss0 = memory_kb()
+
+    if kind == "faiss":
+        with open(os.path.join(data_dir, "texts.json"), encoding="utf-8") as f:
+            texts = json.load(f)
+        vectors = np.load(vectors_path)
+        pairs = list(zip(texts, vectors))
+        t = time.perf_counter()
+        store = FAISS.from_embeddings(pairs, FakeEmbeddings(size=dim))
+        load_s = time.perf_counter() - t
+        # FAISS copies the vectors into its index; the texts live on in its docstore
+        del texts, vectors, pairs
+        search = store.similarity_search_by_vector
+    else:
+        t = time.perf_counter()
+        store = open_vector_store(os.path.join(data_dir, f"{kind}.vbvs"))
+        load_s = time.perf_counter() - t
+        search = store.similarity_search_by_vector
+
+    t = time.perf_counter()
+    for q in queries:
+        search(q.tolist() if kind == "faiss" else q, k=k)
+    query_ms = (time.perf_counter() - t) / n_queries * 1000
+
+    # Wait until every worker has loaded and queried, so PSS reflects sharing
+    print("ready", flush=True)
+    sys.stdin.readline()
+    rss1, pss1 = memory_kb()
+    print(json.dumps({
+        "load_s": load_s,
+        "query_ms": query_ms,
+        "rss_kb": rss1 - rss0,
+        "pss_kb": None if pss0 is None else pss1 - pss0,
+    }), flush=True)
+    sys.stdin.read()
+
+
+def run_workers(kind: str, data_dir: str, args):
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", kind, "--data-dir", data_dir,
+           "--k", str(args.k), "--queries", str(args.queries)]
+    procs = [subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+             for _ in range(args.workers)]
+    for p in procs:
+        if p.stdout.readline().strip() != "ready":
+            raise RuntimeError(f"{kind} worker exited before loading")
+    results = []
+    for p in procs:
+        p.stdin.write("report\n")
+        p.stdin.flush()
+        results.append(json.loads(p.stdout.readline()))
+    for p in procs:
+        p.stdin.close()
+        p.wait()
+    return results
+
+
+def recall_at_k(vectors, store, queries, k: int):
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    hits = 0
+    for q in queries:
+        exact = set(np.argsort(-(normed @ q))[:k].tolist())
+        hits += len(exact & {i for i, _ in store.search_by_vector(q, k)})
+    return hits / (k * len(queries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="number of chunks")
+    parser.add_argument("--dim", type=int, default=1536, help="embedding size (1536 = OpenAI ada-002)")
+    parser.add_argument("--text-chars", type=int, default=800, help="characters per chunk text")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    parser.add_argument("--worker", choices=KINDS, help=argparse.SUPPRESS)
+    parser.add_argument("--data-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.data_dir, args.k, args.queries)
+        return
+
+    if "faiss" in args.kinds:
+        try:
+            import faiss  # noqa: F401
+        except ImportError:
+            print("faiss is not installed (pip install faiss-cpu); skipping the faiss row")
+            args.kinds = [kind for kind in args.kinds if kind != "faiss"]
+
+    with tempfile.TemporaryDirectory(prefix="vbvs-bench-") as data_dir:
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((args.count, args.dim)).astype(np.float32)
+        filler = "lorem ipsum dolor sit amet " * (args.text_chars // 27 + 1)
+        texts = [f"chunk {i}: {filler}"[:args.text_chars] for i in range(args.count)]
+        np.save(os.path.join(data_dir, "vectors.npy"), vectors)
+        with open(os.path.join(data_dir, "texts.json"), "w", encoding="utf-8") as f:
+            json.dump(texts, f)
+
+        queries = query_vectors(args.dim, args.queries)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        print(f"{args.count} chunks x {args.dim} dims, {args.workers} workers, "
+              f"{args.queries} queries, k={args.k}")
+        print(f"float32 vectors alone: {vectors.nbytes / 2**20:.1f} MB per process")
+        print()
+
+        extra = {}
+        for kind in ("float16", "int8"):
+            if kind not in args.kinds:
+                continue
+            path = os.path.join(data_dir, f"{kind}.vbvs")
+            t = time.perf_counter()
+            write_vector_store(path, texts, vectors, dtype=kind)
+            write_s = time.perf_counter() - t
+            store = open_vector_store(path)
+            extra[kind] = (f"file {os.path.getsize(path) / 2**20:.1f} MB, write {write_s:.2f}s, "
+                           f"recall@{args.k} {recall_at_k(vectors, store, queries, args.k):.3f}")
+            store.close()
+
+        header = (f"{'kind':<8} {'load s':>7} {'query ms':>8} {'RSS MB/worker':>13} "
+                  f"{'PSS MB/worker':>13} {'PSS MB total':>12}")
+        print(header)
+        print("-" * len(header))
+        for kind in args.kinds:
+            results = run_workers(kind, data_dir, args)
+            load_s = statistics.median(r["load_s"] for r in results)
+            query_ms = statistics.median(r["query_ms"] for r in results)
+            rss = statistics.median(r["rss_kb"] for r in results) / 1024
+            pss = [r["pss_kb"] for r in results if r["pss_kb"] is not None]
+            pss_cols = (f"{statistics.median(pss) / 1024:>13.1f} {sum(pss) / 1024:>12.1f}"
+                        if pss else f"{'n/a':>13} {'n/a':>12}")
+            print(f"{kind:<8} {load_s:>7.3f} {query_ms:>8.2f} {rss:>13.1f} {pss_cols}")
+
+        for kind, line in extra.items():
+            print(f"{kind}: {line}")
+
+
+if __name__ == "__main__":
+    main()
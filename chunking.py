@@ -0,0 +1,270 @@
+import re
+
+# -------------------------
+# Chunking Strategies
+# -------------------------
+# Each strategy turns loaded Documents into retrieval chunks. chunk_size and
+# chunk_overlap are in characters, except for "token" where they are in
+# tiktoken tokens. Splitters are imported lazily, like the rest of the pipeline.
+
+CHUNKING_STRATEGIES = {
+    "character": {"chunk_size": 1000, "chunk_overlap": 100},
+    "recursive": {"chunk_size": 1000, "chunk_overlap": 100},
+    "token": {"chunk_size": 250, "chunk_overlap": 25},
+    "sentence": {"chunk_size": 1000, "chunk_overlap": 100},
+    "structure": {"chunk_size": 1000, "chunk_overlap": 100},
+}
+
+DEFAULT_CHUNKING = {"strategy": "character", "chunk_size": 1000, "chunk_overlap": 100}
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+
+# Sentence "ends" that are really abbreviations or list numbers ("Dr.", "e.g.", "3.")
+_NOT_SENTENCE_END = re.compile(r"(?:\b(?:Mr|Mrs|Ms|Dr|Prof|St|No|vs|etc|e\.g|i\.e)|^\d+)\.$", re.IGNORECASE)
+
+_MARKDOWN_HEADING = re.compile(r"^(#{1,6})\s+(\S.*?)\s*$")                 # "## Billing"
+_NUMBERED_HEADING = re.compile(r"^((?:\d+\.)+\d*|\d+)\s+([A-Z][^.!?]{0,80})$")  # "2.1 Refunds"
+_CAPS_HEADING = re.compile(r"^[A-Z][A-Z0-9 ,&:/()\-]{3,80}$")                # "TERMS OF SERVICE"
+
+
+def resolve_chunking(chunking: dict = None):
+    """Fill in per-strategy defaults for a (possibly partial) chunking config."""
+    chunking = dict(chunking or DEFAULT_CHUNKING)
+    strategy = chunking.get("strategy", DEFAULT_CHUNKING["strategy"])
+    if strategy not in CHUNKING_STRATEGIES:
+        raise ValueError(f"Unsupported chunking strategy: {strategy}")
+    defaults = CHUNKING_STRATEGIES[strategy]
+    chunk_size = int(chunking.get("chunk_size") or defaults["chunk_size"])
+    chunk_overlap = chunking.get("chunk_overlap")
+    chunk_overlap = defaults["chunk_overlap"] if chunk_overlap is None else int(chunk_overlap)
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap must be smaller than chunk_size")
+    return {"strategy": strategy, "chunk_size": chunk_size, "chunk_overlap": chunk_overlap}
+
+
+def split_documents(docs: list, chunking: dict = None):
+    chunking = resolve_chunking(chunking)
+    strategy = chunking["strategy"]
+    chunk_size = chunking["chunk_size"]
+    chunk_overlap = chunking["chunk_overlap"]
+
+    if strategy == "structure":
+        return _split_by_structure(docs, chunk_size, chunk_overlap)
+
+    if strategy == "character":
+        from langchain.text_splitter import CharacterTextSplitter
+        splitter = CharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    elif strategy == "recursive":
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    elif strategy == "token":
+        from langchain.text_splitter import TokenTextSplitter
+        splitter = TokenTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    else:
+        return _split_by_sentence(docs, chunk_size, chunk_overlap)
+
+    return splitter.split_documents(docs)
+
+# -------------------------
+# Sentence-aware Splitting
+# -------------------------
+
+def split_sentences(text: str):
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        if paragraph:
+            pending = ""
+            for part in _SENTENCE_END.split(paragraph):
+                pending = f"{pending} {part}" if pending else part
+                if not _NOT_SENTENCE_END.search(pending):
+                    sentences.append(pending)
+                    pending = ""
+            if pending:
+                sentences.append(pending)
+    return sentences
+
+
+def pack_sentences(sentences: list, chunk_size: int, chunk_overlap: int):
+    """Greedily pack whole sentences into chunks, carrying trailing sentences as overlap.
+
+    A single sentence longer than chunk_size becomes its own chunk.
+    """
+    chunks, current, length = [], [], 0
+    for sentence in sentences:
+        if current and length + 1 + len(sentence) > chunk_size:
+            chunks.append(" ".join(current))
+            # Keep as many trailing sentences as fit in the overlap budget
+            carried, carried_len = [], 0
+            for prev in reversed(current):
+                if carried_len + len(prev) + 1 > chunk_overlap:
+                    break
+                carried.insert(0, prev)
+                carried_len += len(prev) + 1
+            # ...but never so many that the next sentence no longer fits
+            while carried and carried_len + len(sentence) > chunk_size:
+                carried_len -= len(carried.pop(0)) + 1
+            current, length = carried, max(carried_len - 1, 0)
+        length += len(sentence) + (1 if current else 0)
+        current.append(sentence)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def _split_by_sentence(docs: list, chunk_size: int, chunk_overlap: int):
+    from langchain.docstore.document import Document
+
+    chunks = []
+    for doc in docs:
+        for text in pack_sentences(split_sentences(doc.page_content), chunk_size, chunk_overlap):
+            chunks.append(Document(page_content=text, metadata=dict(doc.metadata)))
+    return chunks
+
+# -------------------------
+# Structure-aware Splitting
+# -------------------------
+
+def _numbering(line: str):
+    """Return the number parts of a numbered line ("2.1 Refunds" -> (2, 1)), else None."""
+    match = _NUMBERED_HEADING.match(line.strip())
+    if not match:
+        return None
+    return tuple(int(p) for p in match.group(1).split(".") if p)
+
+
+def _is_list_item(lines: list, i: int):
+    """True if lines[i] is adjacent to a numbered line that continues its sequence.
+
+    "1. Click the button" followed by "2. Open the menu" is a list; "2. Orders"
+    followed by "2.1 Processing" (a deeper level) or separated from "3. Returns"
+    by body text is not.
+    """
+    number = _numbering(lines[i])
+    for j, step in ((i - 1, 1), (i + 1, -1)):
+        if 0 <= j < len(lines):
+            other = _numbering(lines[j])
+            if (other and len(other) == len(number) and other[:-1] == number[:-1]
+                    and number[-1] - other[-1] == step):
+                return True
+    return False
+
+
+def _heading_level(lines: list, i: int):
+    """Return the nesting level if lines[i] is a heading, else None.
+
+    Numbered lines are headings unless they sit in a run of consecutively
+    numbered lines of the same level, i.e. a numbered list. Works with PDF
+    text, which rarely has blank lines around headings. All-caps lines are
+    level 0.
+    """
+    line = lines[i].strip()
+    match = _MARKDOWN_HEADING.match(line)
+    if match:
+        return len(match.group(1))
+    number = _numbering(line)
+    if number:
+        return None if _is_list_item(lines, i) else len(number)
+    if _CAPS_HEADING.match(line):
+        return 0
+    return None
+
+
+def split_sections(text: str):
+    """Split text at heading-like lines.
+
+    Returns (heading path, body) pairs, where the path joins every enclosing
+    heading with " / " (e.g. "2. Orders and Delivery / 2.2 Delivery Times").
+    The path is "" for text before the first heading.
+    """
+    lines = text.splitlines()
+    sections, stack, body = [], [], []
+
+    def flush():
+        if any(b.strip() for b in body):
+            sections.append((" / ".join(title for _, title in stack), "\n".join(body).strip()))
+
+    for i, line in enumerate(lines):
+        level = _heading_level(lines, i) if line.strip() else None
+        if level is None:
+            body.append(line)
+            continue
+        flush()
+        body = []
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, line.strip().lstrip("#").strip()))
+    flush()
+    return sections
+
+
+def _running_headers(docs: list):
+    """Lines repeated at the top or bottom of most pages, e.g. a company name."""
+    if len(docs) < 3:
+        return set()
+    counts = {}
+    for doc in docs:
+        lines = [l.strip() for l in doc.page_content.splitlines() if l.strip()]
+        for line in set(lines[:2] + lines[-2:]):
+            counts[line] = counts.get(line, 0) + 1
+    return {line for line, n in counts.items() if n > len(docs) // 2}
+
+
+def _parent(heading: str):
+    return heading.rsplit(" / ", 1)[0] if " / " in heading else ""
+
+
+def _split_by_structure(docs: list, chunk_size: int, chunk_overlap: int):
+    """Split along headings, then pack adjacent sibling sections up to chunk_size.
+
+    Chunks never cross pages (PDF loaders yield one Document per page), and
+    only sections under the same parent heading are packed together, so a
+    chunk never spans e.g. "1. Overview" and "2.1 Order Processing". Each
+    section is prefixed with its heading path so it is embedded with its
+    context; sections larger than chunk_size are split recursively. Running
+    page headers and footers are dropped.
+
+    Metadata: "sections" lists the heading path of every section in the
+    chunk; "section" is that path for a single section, or the shared parent
+    path for a pack of siblings.
+    """
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    from langchain.docstore.document import Document
+
+    running = _running_headers(docs)
+    chunks = []
+    for doc in docs:
+        text = "\n".join(l for l in doc.page_content.splitlines() if l.strip() not in running)
+        pending = []  # (heading, rendered text)
+
+        def flush():
+            if pending:
+                headings = [h for h, _ in pending]
+                metadata = dict(doc.metadata)
+                section = headings[0] if len(headings) == 1 else _parent(headings[0])
+                if section:
+                    metadata["section"] = section
+                if any(headings):
+                    metadata["sections"] = headings
+                chunks.append(Document(page_content="\n\n".join(t for _, t in pending), metadata=metadata))
+                pending.clear()
+
+        for heading, body in split_sections(text):
+            section = f"{heading}\n{body}" if heading else body
+            if len(section) > chunk_size:
+                flush()
+                budget = max(chunk_size - len(heading) - 1, chunk_size // 2)
+                splitter = RecursiveCharacterTextSplitter(
+                    chunk_size=budget, chunk_overlap=min(chunk_overlap, budget // 2))
+                for piece in splitter.split_text(body):
+                    pending.append((heading, f"{heading}\n{piece}" if heading else piece))
+                    flush()
+                continue
+            if pending and (
+                _parent(pending[0][0]) != _parent(heading)
+                or sum(len(t) + 2 for _, t in pending) + len(section) > chunk_size
+            ):
+                flush()
+            pending.append((heading, section))
+        flush()
+    return chunks
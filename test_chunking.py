@@ -0,0 +1,88 @@
+import pytest
+
+from chunking import pack_sentences, split_documents, split_sections, split_sentences
+
+
+def test_split_sentences_keeps_abbreviations_and_list_numbers():
+    text = "Ask Dr. Smith first. 1. The customer must pay. Then go.\n\nNew paragraph here."
+    assert split_sentences(text) == [
+        "Ask Dr. Smith first.",
+        "1. The customer must pay.",
+        "Then go.",
+        "New paragraph here.",
+    ]
+
+
+def test_pack_sentences_respects_chunk_size_with_overlap():
+    chunks = pack_sentences(["a" * 90, "b" * 950, "c" * 10], 1000, 100)
+    assert all(len(c) <= 1000 for c in chunks)
+    assert chunks == ["a" * 90, "b" * 950 + " " + "c" * 10]
+
+
+def test_pack_sentences_carries_trailing_sentences_as_overlap():
+    sentences = ["one two.", "three four.", "five six.", "seven eight."]
+    chunks = pack_sentences(sentences, 25, 12)
+    assert chunks == ["one two. three four.", "three four. five six.", "five six. seven eight."]
+
+
+def test_pack_sentences_keeps_oversized_sentence_whole():
+    assert pack_sentences(["x" * 50, "y"], 20, 5) == ["x" * 50, "y"]
+
+
+def test_split_sections_builds_full_heading_path():
+    text = (
+        "POLICY\n\n"
+        "2. Orders\n\n"
+        "2.1 Processing\nSame day.\n\n"
+        "2.2 Delivery\nThree days.\n\n"
+        "3. Returns\nThirty days.\n"
+    )
+    assert split_sections(text) == [
+        ("POLICY / 2. Orders / 2.1 Processing", "Same day."),
+        ("POLICY / 2. Orders / 2.2 Delivery", "Three days."),
+        ("POLICY / 3. Returns", "Thirty days."),
+    ]
+
+
+def test_split_sections_ignores_numbered_lists():
+    text = "## Setup\nSteps:\n\n1. Click the button\n2. Open the menu\n"
+    assert split_sections(text) == [("Setup", "Steps:\n\n1. Click the button\n2. Open the menu")]
+
+
+def test_split_sections_keeps_text_before_first_heading():
+    assert split_sections("intro text\n# Title\nbody") == [("", "intro text"), ("Title", "body")]
+
+
+def test_split_sections_handles_pdf_text_without_blank_lines():
+    text = (
+        "1. Overview\nBody.\n"
+        "2. Orders and Delivery\n"
+        "2.1 Order Processing\nText one.\n"
+        "2.2 Delivery Times\nText two."
+    )
+    assert split_sections(text) == [
+        ("1. Overview", "Body."),
+        ("2. Orders and Delivery / 2.1 Order Processing", "Text one."),
+        ("2. Orders and Delivery / 2.2 Delivery Times", "Text two."),
+    ]
+
+
+def test_split_sections_keeps_list_without_blank_line_in_body():
+    text = "## Setup\nSteps:\n1. Click the button\n2. Open the menu\n3. Save"
+    assert split_sections(text) == [
+        ("Setup", "Steps:\n1. Click the button\n2. Open the menu\n3. Save"),
+    ]
+
+
+def test_structure_packs_only_siblings_and_records_every_section():
+    pytest.importorskip("langchain.text_splitter")
+    from langchain.docstore.document import Document
+
+    text = "1. Overview\nIntro.\n2. Orders\n2.1 Processing\nSame day.\n2.2 Delivery\nThree days."
+    chunks = split_documents([Document(page_content=text, metadata={"page": 0})],
+                             {"strategy": "structure"})
+    assert [c.metadata for c in chunks] == [
+        {"page": 0, "section": "1. Overview", "sections": ["1. Overview"]},
+        {"page": 0, "section": "2. Orders",
+         "sections": ["2. Orders / 2.1 Processing", "2. Orders / 2.2 Delivery"]},
+    ]
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("langchain_core")
+
+import utils_local
+from vector_store import open_vector_store, write_vector_store
+
+
+class FakeEmbeddings:
+    """Maps known texts to fixed vectors; anything else to the first axis."""
+
+    model = "fake"
+
+    def __init__(self, vectors: dict):
+        self.vectors = vectors
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        return self.vectors.get(text, [1.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int8"])
+def test_round_trip_keeps_order_text_and_metadata(tmp_path, dtype):
+    texts = ["déjà vu", "日本語のテキスト", "plain"]
+    vectors = [[1.0, 0.0, 0.0], [0.8, 0.6, 0.0], [0.0, 0.0, 1.0]]
+    metadatas = [{"section": "Résumé"}, {"page": 2, "tags": ["ü"]}, {}]
+    path = write_vector_store(str(tmp_path / "s.vbvs"), texts, vectors, metadatas, dtype=dtype)
+
+    store = open_vector_store(path)
+    assert (len(store), store.dim, store.dtype) == (3, 3, dtype)
+    hits = store.search_by_vector([1.0, 0.1, 0.0], k=3)
+    assert [i for i, _ in hits] == [0, 1, 2]
+    assert hits[0][1] == pytest.approx(0.995, abs=0.01)
+    docs = store.similarity_search_by_vector([0.0, 0.0, 2.0], k=1)
+    assert docs[0].page_content == "plain"
+    assert store.get_document(1).page_content == "日本語のテキスト"
+    assert store.get_document(1).metadata == {"page": 2, "tags": ["ü"]}
+    assert store.get_document(0).metadata == {"section": "Résumé"}
+    store.close()
+
+
+def test_empty_store(tmp_path):
+    path = write_vector_store(str(tmp_path / "e.vbvs"), [], np.empty((0, 4), dtype=np.float32))
+    store = open_vector_store(path)
+    assert len(store) == 0
+    assert store.search_by_vector([1.0, 0.0, 0.0, 0.0], k=5) == []
+    store.close()
+
+
+def test_bad_magic_raises(tmp_path):
+    path = tmp_path / "bad.vbvs"
+    path.write_bytes(b"NOPE" + b"\0" * 100)
+    with pytest.raises(ValueError, match="Not a vector store file"):
+        open_vector_store(str(path))
+
+
+def test_prune_keeps_new_file_and_deletes_oldest_first(tmp_path, monkeypatch):
+    for i in range(4):
+        path = tmp_path / f"{i}.vbvs"
+        path.write_bytes(b"x" * 2**20)
+        os.utime(path, (1000 + i, 1000 + i))
+    monkeypatch.setenv("VOICEBOT_INDEX_MAX_MB", "2.5")
+
+    utils_local._prune_index_dir(str(tmp_path), keep=str(tmp_path / "0.vbvs"))
+
+    assert sorted(os.listdir(tmp_path)) == ["0.vbvs", "3.vbvs"]
+
+
+def test_persisted_retriever_reuses_and_rebuilds_pruned_index(tmp_path, monkeypatch):
+    pytest.importorskip("langchain_community")
+    doc = tmp_path / "doc.txt"
+    doc.write_text("Refunds take five days.", encoding="utf-8")
+    index_dir = tmp_path / "index"
+    monkeypatch.setattr(utils_local, "_get_embeddings", lambda: FakeEmbeddings({}))
+
+    retriever = utils_local.load_document_vectorstore(str(doc), index_dir=str(index_dir))
+    assert retriever.invoke("refunds")[0].page_content == "Refunds take five days."
+    files = os.listdir(index_dir)
+    assert len(files) == 1
+
+    # Same content and settings reuse the file; a pruned file is rebuilt
+    utils_local.load_document_vectorstore(str(doc), index_dir=str(index_dir))
+    assert os.listdir(index_dir) == files
+    os.remove(index_dir / files[0])
+    retriever = utils_local.load_document_vectorstore(str(doc), index_dir=str(index_dir))
+    assert os.listdir(index_dir) == files
+    assert retriever.invoke("refunds")[0].page_content == "Refunds take five days."
@@ -1,23 +1,44 @@
 import uuid
+import os
+import json
+import hashlib
+import glob
+import threading
+from functools import lru_cache
 from io import BytesIO
-from gtts import gTTS
-from deep_translator import GoogleTranslator
-from langchain.chains import ConversationalRetrievalChain
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader, TextLoader, Docx2txtLoader
-from langchain.docstore.document import Document
-from langchain.memory import ConversationBufferMemory
-import speech_recognition as sr
-import tempfile
 import re
+from chunking import resolve_chunking, split_documents
+
+# -------------------------
+# Lazy Backend Loaders
+# -------------------------
+# LangChain, FAISS, gTTS, deep_translator and speech_recognition are slow to
+# import, so they are loaded on first use instead of at module import. This
+# keeps the login page fast; start_background_warm_up() can preload them.
+
+@lru_cache(maxsize=None)
+def _get_llm():
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(temperature=0.2, model_name="gpt-4o")
+
+@lru_cache(maxsize=None)
+def _get_embeddings():
+    from langchain_openai import OpenAIEmbeddings
+    return OpenAIEmbeddings()
+
+def _get_translator(source: str, target: str):
+    # Not cached: GoogleTranslator.translate() mutates instance state, so a
+    # shared instance is unsafe across session threads. Construction is cheap.
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator(source=source, target=target)
 
 # -------------------------
 # Document + Embedding Utils
 # -------------------------
 
-def load_document_vectorstore(file_path: str):
+def load_documents(file_path: str):
+    from langchain_community.document_loaders import PyPDFLoader, TextLoader, Docx2txtLoader
+
     if file_path.endswith(".pdf"):
         loader = PyPDFLoader(file_path)
     elif file_path.endswith(".txt"):
@@ -26,20 +47,132 @@ def load_document_vectorstore(file_path: str):
         loader = Docx2txtLoader(file_path)
     else:
         raise ValueError("Unsupported file format")
+    return loader.load()
+
+def load_document_vectorstore(file_path: str, chunking: dict = None, index_dir: str = None):
+    """Index a document and return a retriever over it.
+
+    `chunking` selects the splitter for this collection, e.g.
+    {"strategy": "structure", "chunk_size": 800, "chunk_overlap": 80};
+    see chunking.CHUNKING_STRATEGIES. Defaults to the original
+    1000/100 character splitter.
+
+    If `index_dir` (or VOICEBOT_INDEX_DIR) is set, the index is persisted there
+    as a compact memory-mapped file (see vector_store.py) keyed by document
+    content and chunking, and reused by every worker process that opens the
+    same document. Otherwise an in-memory FAISS index is built.
 
-    docs = loader.load()
-    splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-    chunks = splitter.split_documents(docs)
-    embeddings = OpenAIEmbeddings()
-    vectorstore = FAISS.from_documents(chunks, embeddings)
+    Every document/chunking/dtype combination gets its own file, so the
+    directory is capped at VOICEBOT_INDEX_MAX_MB (default 2048): after a new
+    file is written, the least recently used .vbvs files are deleted until the
+    total fits. Deleting is safe while other workers have a file mapped; they
+    keep their mapping and rebuild on their next load. Set the limit to 0 to
+    disable pruning and clean the directory yourself.
+
+    The limit bounds the files in the directory, not disk use: on POSIX a
+    deleted file's space is freed only once every process unmaps it. Workers
+    drop deleted files from their store cache on the next load, but an open
+    session's retriever keeps its mapping alive until the session ends. Allow
+    some headroom above VOICEBOT_INDEX_MAX_MB.
+    """
+    index_dir = index_dir or os.getenv("VOICEBOT_INDEX_DIR")
+    if index_dir:
+        return _load_persisted_retriever(file_path, chunking, index_dir)
+
+    from langchain_community.vectorstores import FAISS
+
+    docs = load_documents(file_path)
+    chunks = split_documents(docs, chunking)
+    vectorstore = FAISS.from_documents(chunks, _get_embeddings())
     return vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 5})
 
+_open_stores = {}
+_open_stores_lock = threading.Lock()
+_MAX_OPEN_STORES = 32
+
+def _open_vector_store(path: str):
+    """Return the process-wide MmapVectorStore for `path`, opening it if needed.
+
+    One mapping per file is shared by every session in this worker. Entries
+    whose file has been deleted (pruned) or replaced are dropped from the cache
+    on every call, so the mapping is released once no session retriever still
+    holds it; only then does the OS free the disk space.
+    """
+    from vector_store import open_vector_store
+
+    with _open_stores_lock:
+        for cached_path, store in list(_open_stores.items()):
+            try:
+                inode = os.stat(cached_path).st_ino
+            except FileNotFoundError:
+                inode = None
+            if inode != store.inode:
+                del _open_stores[cached_path]
+        store = _open_stores.pop(path, None) or open_vector_store(path)
+        _open_stores[path] = store  # most recently used last
+        while len(_open_stores) > _MAX_OPEN_STORES:
+            del _open_stores[next(iter(_open_stores))]
+        return store
+
+def _load_persisted_retriever(file_path: str, chunking: dict, index_dir: str):
+    from vector_store import build_vector_store
+
+    dtype = os.getenv("VOICEBOT_INDEX_DTYPE", "float16")
+    embeddings = _get_embeddings()
+    key = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            key.update(block)
+    key.update(json.dumps([resolve_chunking(chunking), dtype, getattr(embeddings, "model", "")],
+                          sort_keys=True).encode("utf-8"))
+    path = os.path.join(index_dir, f"{key.hexdigest()[:32]}.vbvs")
+
+    try:
+        os.utime(path)  # mark as recently used for pruning
+        return _open_vector_store(path).as_retriever(embeddings, k=5)
+    except FileNotFoundError:
+        pass  # never built, or pruned by another worker since
+
+    os.makedirs(index_dir, exist_ok=True)
+    chunks = split_documents(load_documents(file_path), chunking)
+    build_vector_store(path, chunks, embeddings, dtype=dtype)
+    _prune_index_dir(index_dir, keep=path)
+    return _open_vector_store(path).as_retriever(embeddings, k=5)
+
+def _index_files_by_age(index_dir: str):
+    """Return [(mtime, size, path)] for the .vbvs files in index_dir, oldest first."""
+    files = []
+    for path in glob.glob(os.path.join(index_dir, "*.vbvs")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue  # removed by another worker meanwhile
+        files.append((stat.st_mtime, stat.st_size, path))
+    return sorted(files)
+
+def _prune_index_dir(index_dir: str, keep: str):
+    max_bytes = float(os.getenv("VOICEBOT_INDEX_MAX_MB", "2048")) * 2**20
+    if max_bytes <= 0:
+        return
+    files = _index_files_by_age(index_dir)
+    total = sum(size for _, size, _ in files)
+    for _, size, path in files:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
 # -------------------------
 # QA Chain + History Prompt
 # -------------------------
 
 def get_qa_response(query: str, retriever, history: list = None, target_lang: str = "en"):
-    llm = ChatOpenAI(temperature=0.2, model_name="gpt-4o")
+    llm = _get_llm()
 
     QA_PROMPT = """
     You are a helpful assistant answering user questions based only on the document context and chat history.
@@ -62,14 +195,13 @@ def get_qa_response(query: str, retriever, history: list = None, target_lang: st
     }
 
     def is_friendly_query(query: str):
-        import re
         normalized = re.sub(r"[^\w\s]", "", query.strip().lower())
         return normalized in friendly_phrases
 
     # Translate query to English if needed
     if target_lang != "en":
         try:
-            query_in_english = GoogleTranslator(source="auto", target='en').translate(query)
+            query_in_english = _get_translator("auto", "en").translate(query)
         except:
             query_in_english = query
     else:
@@ -78,7 +210,7 @@ def get_qa_response(query: str, retriever, history: list = None, target_lang: st
     if is_friendly_query(query_in_english):
         response_text = "Hello! How can I assist you today?"
         if target_lang != "en":
-            response_text = GoogleTranslator(source='en', target=target_lang).translate(response_text)
+            response_text = _get_translator("en", target_lang).translate(response_text)
         return response_text, "", ""
 
     # Translate chat history if needed
@@ -90,8 +222,8 @@ def get_qa_response(query: str, retriever, history: list = None, target_lang: st
             if q and a and not is_friendly_query(q):
                 if target_lang != "en":
                     try:
-                        q = GoogleTranslator(source="auto", target='en').translate(q)
-                        a = GoogleTranslator(source="auto", target='en').translate(a)
+                        q = _get_translator("auto", "en").translate(q)
+                        a = _get_translator("auto", "en").translate(a)
                     except:
                         pass
                 history_block += f"User: {q}\nAssistant: {a}\n"
@@ -110,7 +242,7 @@ def get_qa_response(query: str, retriever, history: list = None, target_lang: st
     # Translate answer back to target language
     if target_lang != "en":
         try:
-            translated_answer = GoogleTranslator(source='en', target=target_lang).translate(answer)
+            translated_answer = _get_translator("en", target_lang).translate(answer)
         except:
             translated_answer = answer
     else:
@@ -123,7 +255,7 @@ def get_qa_response(query: str, retriever, history: list = None, target_lang: st
 # -------------------------
 
 def translate_text(text: str, target_lang: str):
-    return GoogleTranslator(source="auto", target=target_lang).translate(text)
+    return _get_translator("auto", target_lang).translate(text)
 
 def get_language_code(language_name: str):
     lang_map = {
@@ -138,6 +270,7 @@ def get_language_code(language_name: str):
 # -------------------------
 
 def text_to_audio(text: str, lang_code: str):
+    from gtts import gTTS
     tts = gTTS(text=text, lang=lang_code)
     audio = BytesIO()
     tts.write_to_fp(audio)
@@ -145,6 +278,7 @@ def text_to_audio(text: str, lang_code: str):
     return audio
 
 def transcribe_audio_file(audio_path: str, language_code: str = "en"):
+    import speech_recognition as sr
     recognizer = sr.Recognizer()
     with sr.AudioFile(audio_path) as source:
         audio_data = recognizer.record(source)
@@ -161,3 +295,64 @@ def transcribe_audio_file(audio_path: str, language_code: str = "en"):
 
 def generate_session_id():
     return str(uuid.uuid4())[:8]
+
+# -------------------------
+# Warm-up Utilities
+# -------------------------
+
+_warm_up_lock = threading.Lock()
+_warm_up_thread = None
+
+_WARM_UP_MAX_INDEXES = 4
+_WARM_UP_MAX_BYTES = 256 * 2**20
+
+def warm_up():
+    """Open persisted indexes, import the heavy backends and build the shared clients.
+
+    With VOICEBOT_INDEX_DIR set, up to _WARM_UP_MAX_INDEXES of the newest .vbvs
+    files (at most _WARM_UP_MAX_BYTES in total) are mapped and prefetched so a
+    returning document is answered without touching disk. This runs first so
+    a failing import further down cannot skip it.
+    """
+    index_dir = os.getenv("VOICEBOT_INDEX_DIR")
+    if index_dir and os.path.isdir(index_dir):
+        budget = _WARM_UP_MAX_BYTES
+        newest = list(reversed(_index_files_by_age(index_dir)))
+        for _, size, path in newest[:_WARM_UP_MAX_INDEXES]:
+            if size > budget:
+                break
+            try:
+                _open_vector_store(path).prefetch()
+            except FileNotFoundError:
+                continue  # pruned by another worker meanwhile
+            budget -= size
+
+    import langchain_community.document_loaders  # noqa: F401
+    import langchain.text_splitter  # noqa: F401
+    if not index_dir:
+        # Only the in-memory FAISS path needs faiss
+        import langchain_community.vectorstores  # noqa: F401
+        import faiss  # noqa: F401
+    import gtts  # noqa: F401
+    import speech_recognition  # noqa: F401
+    import deep_translator  # noqa: F401
+    _get_embeddings()
+    _get_llm()
+
+def _warm_up_quietly():
+    try:
+        warm_up()
+    except Exception:
+        # Warm-up is best effort; the same error will surface on first real use.
+        pass
+
+def start_background_warm_up():
+    """Run warm_up() once per process in a daemon thread and return that thread."""
+    global _warm_up_thread
+    with _warm_up_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(
+                target=_warm_up_quietly, name="voicebot-warm-up", daemon=True
+            )
+            _warm_up_thread.start()
+    return _warm_up_thread
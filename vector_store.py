@@ -0,0 +1,199 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+# -------------------------
+# Compact On-disk Vector Store
+# -------------------------
+# One file holds quantized, L2-normalised vectors plus the chunk texts and
+# metadata. Readers open it read-only with mmap, so every worker process that
+# opens the same file shares its pages through the OS page cache instead of
+# keeping a private FAISS index and docstore in RAM.
+#
+# Layout (little-endian):
+#   header   magic, version, dtype, dim, count and section offsets (64 bytes)
+#   vectors  count x dim float16 or int8, 64-byte aligned
+#   scales   count float32, int8 only (per-row dequantization scale)
+#   offsets  (count + 1) uint64 text offsets, then (count + 1) uint64 metadata offsets
+#   blob     UTF-8 chunk texts followed by UTF-8 JSON metadata
+
+MAGIC = b"VBVS"
+VERSION = 1
+DTYPES = {"float16": 1, "int8": 2}
+_HEADER = struct.Struct("<4sHHIQQQQQ12x")
+_ALIGN = 64
+_SEARCH_BLOCK = 256  # rows dequantized per step: ~1.5 MB of float32 at dim 1536
+
+
+def _align(offset: int):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def write_vector_store(path: str, texts: list, vectors, metadatas: list = None, dtype: str = "float16"):
+    """Write texts and their embedding vectors to a single store file at `path`.
+
+    The file is written to a temporary name and renamed into place, so readers
+    in other processes never see a partial file.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported vector dtype: {dtype}")
+    vectors = _normalize(vectors)
+    if vectors.ndim != 2 or len(vectors) != len(texts):
+        raise ValueError("Expected one vector per text")
+    metadatas = metadatas or [{} for _ in texts]
+    count, dim = vectors.shape
+
+    scales = None
+    if dtype == "int8":
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        packed = np.round(vectors / scales[:, None]).astype(np.int8)
+        scales = scales.astype(np.float32)
+    else:
+        packed = vectors.astype(np.float16)
+
+    text_bytes = [t.encode("utf-8") for t in texts]
+    meta_bytes = [json.dumps(m, ensure_ascii=False, default=str).encode("utf-8") for m in metadatas]
+    text_offsets = np.concatenate([[0], np.cumsum([len(b) for b in text_bytes])]).astype(np.uint64)
+    meta_offsets = np.concatenate([[0], np.cumsum([len(b) for b in meta_bytes])]).astype(np.uint64)
+    meta_offsets += text_offsets[-1]
+
+    vec_off = _align(_HEADER.size)
+    scale_off = vec_off + packed.nbytes
+    offsets_off = scale_off + (scales.nbytes if scales is not None else 0)
+    blob_off = offsets_off + text_offsets.nbytes + meta_offsets.nbytes
+    header = _HEADER.pack(MAGIC, VERSION, DTYPES[dtype], dim, count,
+                          vec_off, scale_off, offsets_off, blob_off)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(b"\0" * (vec_off - _HEADER.size))
+            f.write(packed.tobytes())
+            if scales is not None:
+                f.write(scales.tobytes())
+            f.write(text_offsets.tobytes())
+            f.write(meta_offsets.tobytes())
+            for b in text_bytes + meta_bytes:
+                f.write(b)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def build_vector_store(path: str, chunks: list, embeddings, dtype: str = "float16"):
+    """Embed LangChain Documents and write them to a store file."""
+    texts = [c.page_content for c in chunks]
+    vectors = embeddings.embed_documents(texts)
+    return write_vector_store(path, texts, vectors, [c.metadata for c in chunks], dtype=dtype)
+
+
+class MmapVectorStore:
+    """Read-only view over a store file.
+
+    Vectors, texts and metadata stay in the shared mapping. Each query only
+    allocates a score per row plus one float32 block of _SEARCH_BLOCK rows.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.inode = os.fstat(f.fileno()).st_ino
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, dtype_code, dim, count, vec_off, scale_off, offsets_off, blob_off = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a vector store file (or unsupported version): {path}")
+
+        self.dim, self.count = dim, count
+        self.dtype = "int8" if dtype_code == DTYPES["int8"] else "float16"
+        self._vectors = np.frombuffer(self._mm, dtype=np.dtype(self.dtype), count=count * dim,
+                                      offset=vec_off).reshape(count, dim)
+        self._scales = None
+        if self.dtype == "int8":
+            self._scales = np.frombuffer(self._mm, dtype=np.float32, count=count, offset=scale_off)
+        self._text_offsets = np.frombuffer(self._mm, dtype=np.uint64, count=count + 1, offset=offsets_off)
+        self._meta_offsets = np.frombuffer(self._mm, dtype=np.uint64, count=count + 1,
+                                           offset=offsets_off + (count + 1) * 8)
+        self._blob_off = blob_off
+
+    def __len__(self):
+        return self.count
+
+    def _read(self, offsets, i: int):
+        start = self._blob_off + int(offsets[i])
+        end = self._blob_off + int(offsets[i + 1])
+        return self._mm[start:end].decode("utf-8")
+
+    def get_document(self, i: int):
+        return Document(page_content=self._read(self._text_offsets, i),
+                        metadata=json.loads(self._read(self._meta_offsets, i)))
+
+    def search_by_vector(self, query_vector, k: int = 5):
+        """Return [(index, cosine similarity)] for the k most similar chunks."""
+        if self.count == 0:
+            return []
+        query = _normalize(query_vector)
+        scores = np.empty(self.count, dtype=np.float32)
+        # Dequantize a small block at a time so a query never materialises the matrix
+        buffer = np.empty((min(_SEARCH_BLOCK, self.count), self.dim), dtype=np.float32)
+        for start in range(0, self.count, _SEARCH_BLOCK):
+            block = self._vectors[start:start + _SEARCH_BLOCK]
+            dequantized = buffer[:len(block)]
+            np.copyto(dequantized, block)
+            np.matmul(dequantized, query, out=scores[start:start + len(block)])
+        if self._scales is not None:
+            scores *= self._scales
+        k = min(k, self.count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def similarity_search_by_vector(self, query_vector, k: int = 5):
+        return [self.get_document(i) for i, _ in self.search_by_vector(query_vector, k)]
+
+    def as_retriever(self, embeddings, k: int = 5):
+        return MmapRetriever(store=self, embeddings=embeddings, k=k)
+
+    def prefetch(self):
+        """Ask the OS to read the file into the page cache ahead of the first query."""
+        if hasattr(mmap, "MADV_WILLNEED"):
+            self._mm.madvise(mmap.MADV_WILLNEED)
+
+    def close(self):
+        self._vectors = self._scales = self._text_offsets = self._meta_offsets = None
+        self._mm.close()
+
+
+def open_vector_store(path: str):
+    return MmapVectorStore(path)
+
+
+class MmapRetriever(BaseRetriever):
+    """LangChain retriever over an MmapVectorStore, a drop-in for FAISS.as_retriever()."""
+
+    store: Any
+    embeddings: Any
+    k: int = 5
+
+    def _get_relevant_documents(self, query: str, *, run_manager=None):
+        return self.store.similarity_search_by_vector(self.embeddings.embed_query(query), self.k)